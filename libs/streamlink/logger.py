@@ -6,9 +6,11 @@ import warnings
 from collections.abc import Iterator
 from logging import CRITICAL, DEBUG, ERROR, INFO, WARNING
 from os import devnull
+from os.path import basename, splitext
 from pathlib import Path
 from sys import version_info
 from threading import Lock
+from time import localtime, strftime
 from typing import IO, TYPE_CHECKING, Literal
 
 # noinspection PyProtectedMember
@@ -31,12 +33,38 @@ class StreamlinkLogger(_BaseLoggerClass):
         """
 
         if not self.isEnabledFor(level):
-            yield from messages
+            return iter(messages)
 
+        return self._iter(level, messages, args, kwargs)
+
+    def _iter(self, level: int, messages: Iterator[str], args: tuple, kwargs: dict) -> Iterator[str]:
+        _log = self._log
+        for message in messages:
+            _log(level, message, args, **kwargs)
+            yield message
+
+    def iter_batched(self, level: int, messages: Iterator[str], *args, sep: str = "\n", **kwargs) -> Iterator[str]:
+        """
+        Iterator wrapper like :meth:`iter`, but logging all consumed items joined together in a single log record
+
+        The items only get logged once the iterator is exhausted, so use :meth:`iter` for logging them as they come.
+        """
+
+        if not self.isEnabledFor(level):
+            return iter(messages)
+
+        return self._iter_batched(level, messages, sep, args, kwargs)
+
+    def _iter_batched(self, level: int, messages: Iterator[str], sep: str, args: tuple, kwargs: dict) -> Iterator[str]:
+        buffer: list[str] = []
+        append = buffer.append
         for message in messages:
-            self._log(level, message, args, **kwargs)
+            append(message)
             yield message
 
+        if buffer:
+            self._log(level, sep.join(buffer), args, **kwargs)
+
 
 FORMAT_STYLE: Literal["%", "{", "$"] = "{"
 FORMAT_BASE = "[{name}][{levelname}] {message}"
@@ -68,60 +96,107 @@ _levelToNames = {
 _custom_levels = TRACE, ALL
 
 
-def _logmethodfactory(level: int, name: str):
-    # fix module name that gets read from the call stack in the logging module
-    # https://github.com/python/cpython/commit/5ca6d7469be53960843df39bb900e9c3359f127f
-    if version_info >= (3, 11):
+# fix module name that gets read from the call stack in the logging module
+# https://github.com/python/cpython/commit/5ca6d7469be53960843df39bb900e9c3359f127f
+if version_info >= (3, 11):
 
+    def _logmethodfactory(level: int, name: str):
         def method(self, message, *args, **kws):
             if self.isEnabledFor(level):
                 # increase the stacklevel by one and skip the `trace()` call here
-                kws["stacklevel"] = 2
-                self._log(level, message, args, **kws)
+                if kws:
+                    kws["stacklevel"] = kws.get("stacklevel", 1) + 1
+                    self._log(level, message, args, **kws)
+                else:
+                    self._log(level, message, args, stacklevel=2)
 
-    else:
+        method.__name__ = name
+        return method
 
+else:
+
+    def _logmethodfactory(level: int, name: str):
         def method(self, message, *args, **kws):
             if self.isEnabledFor(level):
                 self._log(level, message, args, **kws)
 
-    method.__name__ = name
-    return method
-
+        method.__name__ = name
+        return method
+
+
+# Register all level names while acquiring the logging module's lock only once, instead of twice per level.
+# Both names get resolved to their level, but the uppercase name is the canonical one, like with the stdlib's levels.
+# This relies on the logging module's private level name dicts, so fall back to the public API if they're missing.
+try:
+    # noinspection PyProtectedMember,PyUnresolvedReferences
+    with logging._lock:
+        for _level, _name in _levelToNames.items():
+            _upper = _name.upper()
+            logging._levelToName[_level] = _upper
+            logging._nameToLevel[_upper] = _level
+            logging._nameToLevel[_name] = _level
+except AttributeError:  # pragma: no cover
+    for _level, _name in _levelToNames.items():
+        logging.addLevelName(_level, _name)
+        logging.addLevelName(_level, _name.upper())
+
+for _level in _custom_levels:
+    setattr(StreamlinkLogger, _levelToNames[_level], _logmethodfactory(_level, _levelToNames[_level]))
+
+# Map registered level names to their lowercase forms, so that formatting a record doesn't need to allocate a new string
+_levelNamesLower = {
+    **{_name.upper(): _name for _name in _levelToNames.values()},
+    **{_name: _name for _name in _levelToNames.values()},
+}
 
-for _level, _name in _levelToNames.items():
-    logging.addLevelName(_level, _name.upper())
-    logging.addLevelName(_level, _name)
 
-    if _level in _custom_levels:
-        setattr(StreamlinkLogger, _name, _logmethodfactory(_level, _name))
+_config_lock = Lock()
 
 
-_config_lock = Lock()
+# Reusable record with all fields that `logging.Formatter.format()` would add, for validating format strings
+_validation_record = logging.LogRecord("", 1, "", 1, "", None, None)
+_validation_record.message = ""
+_validation_record.asctime = ""
 
 
 class StringFormatter(logging.Formatter):
     def __init__(self, *args, remove_base: list[str] | None = None, **kwargs):
         super().__init__(*args, **kwargs)
         self._remove_base = remove_base or []
+        self._remove_base_prefixes = tuple(f"{rbase}." for rbase in self._remove_base)
         self._usesTime = super().usesTime()
+        self._time_cache: tuple[int, str, str] | None = None
 
-        # Validate the format's fields
-        rec = logging.LogRecord("", 1, "", 1, "", None, None)
-        super().format(rec)
+        # Validate the format's fields (the format's syntax already got validated by the base class)
+        self.formatMessage(_validation_record)
 
     def usesTime(self):
         return self._usesTime
 
     def formatTime(self, record, datefmt=None):
-        tdt = fromlocaltimestamp(record.created)
+        fmt = datefmt or self.default_time_format
+        # only build a datetime object if microseconds are needed, as they are not supported by `time.strftime()`
+        if "%f" in fmt:
+            return fromlocaltimestamp(record.created).strftime(fmt)
+
+        # records created within the same second share the same formatted time
+        created = int(record.created)
+        cache = self._time_cache
+        if cache is not None and cache[0] == created and cache[1] == fmt:
+            return cache[2]
 
-        return tdt.strftime(datefmt or self.default_time_format)
+        formatted = strftime(fmt, localtime(created))
+        self._time_cache = created, fmt, formatted
+
+        return formatted
 
     def format(self, record):
-        for rbase in self._remove_base:
-            record.name = record.name.replace(f"{rbase}.", "")
-        record.levelname = record.levelname.lower()
+        name = record.name
+        for prefix in self._remove_base_prefixes:
+            if name.startswith(prefix):
+                record.name = name[len(prefix) :]
+                break
+        record.levelname = _levelNamesLower.get(record.levelname) or record.levelname.lower()
 
         return super().format(record)
 
@@ -133,7 +208,8 @@ class StreamHandler(logging.StreamHandler):
 
     def flush(self):
         try:
-            super().flush()
+            # call the base class method directly and don't create a `super()` proxy on every flush
+            logging.StreamHandler.flush(self)
         except OSError:
             # Python doesn't raise BrokenPipeError on Windows
             pass
@@ -153,6 +229,9 @@ class StreamHandler(logging.StreamHandler):
 
 
 class WarningLogRecord(logging.LogRecord):
+    # logging.LogRecord doesn't define slots, so only the attributes added here can be stored in slots
+    __slots__ = ("_message",)
+
     msg: WarningMessage  # type: ignore[assignment]
 
     def __init__(self, *args, **kwargs):
@@ -160,26 +239,20 @@ class WarningLogRecord(logging.LogRecord):
         self.name = "warnings"
         self.levelname = self.msg.category.__name__ if self.msg.category else UserWarning.__name__
         self.pathname = self.msg.filename
-        self._path = Path(self.pathname)
-        self.filename = self._path.name
-        self.module = self._path.stem
+        self.filename = basename(self.pathname)
+        self.module = splitext(self.filename)[0]
         self.lineno = self.msg.lineno
-
-    def getMessage(self) -> str:
         if self.msg.category and issubclass(self.msg.category, StreamlinkWarning):
-            return f"{self.msg.message}"
-        return f"{self.msg.message}\n  {self.pathname}:{self.lineno}"
-
-
-def _log_record_factory(name, level, fn, lno, msg, args, exc_info, func=None, sinfo=None, **kwargs):
-    if isinstance(msg, WarningMessage):
-        # noinspection PyTypeChecker
-        return WarningLogRecord(name, level, fn, lno, msg, args, exc_info, func, sinfo)
+            self._message = f"{self.msg.message}"
+        else:
+            self._message = f"{self.msg.message}\n  {self.pathname}:{self.lineno}"
 
-    return _log_record_factory_default(name, level, fn, lno, msg, args, exc_info, func=None, sinfo=None, **kwargs)
+    def getMessage(self) -> str:
+        return self._message
 
 
-# borrowed from stdlib and modified, so that `WarningMessage` gets passed as `msg` to the `WarningLogRecord`
+# borrowed from stdlib and modified, so that `WarningMessage` gets passed as `msg` to the `WarningLogRecord`,
+# which gets built and handled directly instead of going through the logger's log record factory
 def _showwarning(message, category, filename, lineno, file=None, line=None):
     if file is not None:  # pragma: no cover
         if _showwarning_default is not None:
@@ -187,8 +260,12 @@ def _showwarning(message, category, filename, lineno, file=None, line=None):
             _showwarning_default(message, category, filename, lineno, file, line)
         return
 
+    if not root.isEnabledFor(WARNING):
+        return
+
     warning = WarningMessage(message, category, filename, lineno, None, line)
-    root.log(WARNING, warning, stacklevel=2)
+    # noinspection PyTypeChecker
+    root.handle(WarningLogRecord(root.name, WARNING, filename, lineno, warning, (), None))
 
 
 def capturewarnings(capture=False):
@@ -217,25 +294,26 @@ def basicConfig(
     remove_base: list[str] | None = None,
     capture_warnings: bool = False,
 ) -> logging.StreamHandler:
-    with _config_lock:
-        handler: logging.StreamHandler
-        if filename is not None:
-            handler = logging.FileHandler(filename, filemode, encoding="utf-8")
-        else:
-            handler = StreamHandler(stream)
-            # logging.StreamHandler internally falls back to sys.stderr if stream is None
-            # sys.stderr however can also be None if fd2 doesn't exist, so use a devnull FileHandler in this case instead
-            if not handler.stream:
-                handler = logging.FileHandler(devnull)
-
-        formatter = StringFormatter(
-            fmt=format,
-            datefmt=datefmt,
-            style=style,
-            remove_base=remove_base or REMOVE_BASE,
-        )
-        handler.setFormatter(formatter)
+    # set up the handler outside of the config lock, as it doesn't touch any shared state
+    handler: logging.StreamHandler
+    if filename is not None:
+        handler = logging.FileHandler(filename, filemode, encoding="utf-8")
+    else:
+        handler = StreamHandler(stream)
+        # logging.StreamHandler internally falls back to sys.stderr if stream is None
+        # sys.stderr however can also be None if fd2 doesn't exist, so use a devnull FileHandler in this case instead
+        if not handler.stream:
+            handler = logging.FileHandler(devnull)
+
+    formatter = StringFormatter(
+        fmt=format,
+        datefmt=datefmt,
+        style=style,
+        remove_base=remove_base or REMOVE_BASE,
+    )
+    handler.setFormatter(formatter)
 
+    with _config_lock:
         root.addHandler(handler)
         if level is not None:
             root.setLevel(level)
@@ -247,8 +325,6 @@ def basicConfig(
 
 
 _showwarning_default = None
-_log_record_factory_default = logging.getLogRecordFactory()
-logging.setLogRecordFactory(_log_record_factory)
 
 
 logging.setLoggerClass(StreamlinkLogger)